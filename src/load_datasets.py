@@ -1,38 +1,42 @@
 import argparse
 import io
+import json
 import logging
 import os
 from datetime import datetime
 
-import pandas as pd
-from legcop import LegiScan
-
-from state_specific_data_downloads import NY_read_senate_api
-from utils import get_legiscan_api_key, get_ny_senate_api_key
-
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
 
 
+def _raw_data_dir():
+    try:
+        BASE_DIR = os.path.dirname(os.path.dirname((os.path.abspath(__file__))))
+    except NameError:
+        BASE_DIR = os.path.dirname(os.path.dirname(os.getcwd()))
+    return os.path.join(BASE_DIR, "data", "raw")
+
+
+def _cached_path(state, year):
+    return os.path.join(_raw_data_dir(), f"{state}-{year}.json")
+
+
 def load_datasets(state, year):
     """
     checks if datasets are in memory. loads them in if they are, downloads them if they aren't.
     only takes a single (state,year) tuple at a time - loop over it if you want more than one.
     returns bills_df.
+
+    legcop and the API key helper are only imported once we know a download is
+    needed, so a cached run never loads the LegiScan client or prompts for a key.
     """
-    try:
-        BASE_DIR = os.path.dirname(os.path.dirname((os.path.abspath(__file__))))
-    except NameError:
-        BASE_DIR = os.path.dirname(os.path.dirname(os.getcwd()))
-    DATA_DIR = os.path.join(BASE_DIR, "data")
-    RAW_DATA_DIR = os.path.join(DATA_DIR, "raw")
-    PROCESSED_DATA_DIR = os.path.join(DATA_DIR, "processed")
+    import pandas as pd
 
-    print(BASE_DIR, DATA_DIR, RAW_DATA_DIR, PROCESSED_DATA_DIR)
+    file_path = _cached_path(state, year)
+    print(file_path)
 
-    file_path = os.path.join(RAW_DATA_DIR, f"{state}-{year}.json")
     if os.path.exists(file_path):
         logger.info("Dataset already downloaded.")
         try:
@@ -50,6 +54,10 @@ def load_datasets(state, year):
                 + f"Error: {e}"
             )
 
+    from legcop import LegiScan
+
+    from utils import get_legiscan_api_key
+
     legis = LegiScan(get_legiscan_api_key.main())
     logger.info("Initialized LegiScan API")
 
@@ -97,15 +105,24 @@ def load_datasets(state, year):
     return bills_df.reset_index(drop=True)
 
 
+def fetch_ny_senate(year):
+    """
+    downloads the NY senate bills for `year`. the senate API module and its key
+    are only loaded here, so nothing touches the network or prompts for
+    credentials unless a download is actually needed.
+    """
+    from state_specific_data_downloads import NY_read_senate_api
+    from utils import get_ny_senate_api_key
+
+    return NY_read_senate_api.main(year, get_ny_senate_api_key.main())
+
+
 def main(state, year):
-    try:
-        BASE_DIR = os.path.dirname(os.path.dirname((os.path.abspath(__file__))))
-    except NameError:
-        BASE_DIR = os.path.dirname(os.path.dirname(os.getcwd()))
-    DATA_DIR = os.path.join(BASE_DIR, "data")
-    RAW_DATA_DIR = os.path.join(DATA_DIR, "raw")
+    RAW_DATA_DIR = _raw_data_dir()
 
     if state == "NY":
+        import pandas as pd
+
         outputs = []
         sen = None
         leg = None
@@ -125,7 +142,7 @@ def main(state, year):
             redownload = input("y/[n]: ") or "n"
             if redownload.lower() == "y":
                 logger.info("Redownloading")
-                sen = NY_read_senate_api.main(year, get_ny_senate_api_key.main())
+                sen = fetch_ny_senate(year)
             logger.info("Using existing data.")
             sen = pd.read_json(senate_api_data_path)
         logger.info("Downloading NY bills from senate api.")
@@ -148,7 +165,7 @@ def main(state, year):
         if isinstance(sen, pd.DataFrame):
             outputs.append(sen)
         else:
-            sen = NY_read_senate_api.main(year, get_ny_senate_api_key.main())
+            sen = fetch_ny_senate(year)
             outputs.append(sen)
 
         if isinstance(leg, pd.DataFrame):
@@ -170,4 +187,23 @@ if __name__ == "__main__":
     )
     parser.add_argument("--year", type=int, required=True, help="Year (e.g., 2023)")
     args = parser.parse_args()
-    main(args.state, args.year)
+
+    # run from the command line, this script only needs to make sure the dataset
+    # is on disk, so skip loading it into pandas if it already is. the stdlib
+    # json.load still catches a truncated or corrupt file, which falls through
+    # to main and gets redownloaded. NY always goes through main, since it asks
+    # whether to redownload.
+    cached = False
+    cached_path = _cached_path(args.state, args.year)
+    if args.state != "NY" and os.path.exists(cached_path):
+        try:
+            with open(cached_path) as f:
+                json.load(f)
+            cached = True
+        except (OSError, ValueError) as e:
+            logger.error(f"Couldn't read {cached_path}, redownloading. Error: {e}")
+
+    if cached:
+        logger.info(f"Dataset already downloaded to {cached_path}.")
+    else:
+        main(args.state, args.year)
@@ -10,8 +10,6 @@ import requests
 
 from utils import get_ny_senate_api_key
 
-get_ny_senate_api_key.main()
-
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
@@ -0,0 +1,111 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+
+NETWORK_MODULES = ["legcop", "requests", "dotenv"]
+
+# patches input() so that any credential prompt fails loudly instead of blocking
+NO_INPUT = (
+    "import builtins\n"
+    "def _no_input(*args, **kwargs):\n"
+    "    raise AssertionError('input() called')\n"
+    "builtins.input = _no_input\n"
+)
+
+
+def run_python(code, cwd=SRC_DIR, check=True):
+    env = dict(os.environ, PYTHONPATH=cwd)
+    env.pop("LEGISCAN_API_KEY", None)
+    env.pop("NY_SENATE_API_KEY", None)
+    result = subprocess.run(
+        [sys.executable, "-c", NO_INPUT + code],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        stdin=subprocess.DEVNULL,
+    )
+    if check:
+        assert result.returncode == 0, result.stderr
+    return result
+
+
+def assert_not_imported(modules):
+    return (
+        "import sys\n"
+        f"imported = sorted(set({modules!r}) & set(sys.modules))\n"
+        "assert not imported, imported\n"
+    )
+
+
+@pytest.fixture
+def cached_tree(tmp_path):
+    """a copy of src/ with a small cached CA-2023 dataset next to it."""
+    shutil.copytree(SRC_DIR, tmp_path / "src")
+    raw_dir = tmp_path / "data" / "raw"
+    raw_dir.mkdir(parents=True)
+    with open(raw_dir / "CA-2023.json", "w") as f:
+        json.dump([{"bill_id": 1, "bill_number": "A1"}], f)
+    return str(tmp_path / "src")
+
+
+def test_import_load_datasets_is_stdlib_only():
+    run_python(
+        "import load_datasets\n"
+        + assert_not_imported(
+            NETWORK_MODULES
+            + ["pandas", "state_specific_data_downloads.NY_read_senate_api"]
+        )
+    )
+
+
+def test_import_ny_senate_api_does_not_prompt():
+    pytest.importorskip("pandas")
+    pytest.importorskip("requests")
+    pytest.importorskip("dotenv")
+    run_python("import state_specific_data_downloads.NY_read_senate_api\n")
+
+
+def test_cached_cli_run_skips_network_clients(cached_tree):
+    result = run_python(
+        "import runpy, sys\n"
+        "sys.argv = ['load_datasets.py', '--state', 'CA', '--year', '2023']\n"
+        "runpy.run_path('load_datasets.py', run_name='__main__')\n"
+        + assert_not_imported(NETWORK_MODULES + ["pandas"]),
+        cwd=cached_tree,
+    )
+    assert "Dataset already downloaded" in result.stderr
+
+
+def test_corrupt_cache_is_not_reported_as_cached(cached_tree):
+    with open(os.path.join(cached_tree, "..", "data", "raw", "CA-2023.json"), "w") as f:
+        f.write('[{"bill_id": 1, "bill_nu')
+    # falling through to a redownload hits the patched input() when asking for a
+    # LegiScan key, so the run itself is expected to fail here.
+    result = run_python(
+        "import runpy, sys\n"
+        "sys.argv = ['load_datasets.py', '--state', 'CA', '--year', '2023']\n"
+        "runpy.run_path('load_datasets.py', run_name='__main__')\n",
+        cwd=cached_tree,
+        check=False,
+    )
+    assert "Couldn't read" in result.stderr
+    assert "Dataset already downloaded to" not in result.stderr
+    assert "input() called" in result.stderr
+
+
+def test_cached_load_skips_network_clients(cached_tree):
+    pytest.importorskip("pandas")
+    run_python(
+        "import load_datasets\n"
+        "bills_df = load_datasets.main('CA', 2023)\n"
+        "assert list(bills_df['bill_number']) == ['A1']\n"
+        + assert_not_imported(NETWORK_MODULES),
+        cwd=cached_tree,
+    )